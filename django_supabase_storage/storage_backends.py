@@ -5,18 +5,280 @@ This backend uploads ALL files directly to Supabase buckets ONLY.
 No files are ever stored locally - everything goes to Supabase.
 """
 
+import base64
 import logging
+import mimetypes
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from functools import lru_cache
 from io import BytesIO
+from tempfile import SpooledTemporaryFile
+from urllib.parse import quote, urljoin
 from django.core.files.storage import Storage
+from django.core.signals import setting_changed
 from django.conf import settings
+from django.dispatch import receiver
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 
 try:
+    import httpx
     from supabase import create_client
 except ImportError:
+    httpx = None
     create_client = None
 
+try:
+    from supabase import ClientOptions
+except ImportError:
+    ClientOptions = None
+
+try:
+    from storage3.utils import StorageException
+except ImportError:
+    class StorageException(Exception):
+        """Stand-in so the except clauses below stay valid without storage3."""
+
+# Errors a request to Supabase can fail with. Only these are caught; anything
+# else is a bug and propagates.
+REQUEST_ERRORS = (httpx.HTTPError, StorageException) if httpx is not None else (StorageException,)
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
+
+# Supabase clients keyed by (url, key), shared by every storage instance so
+# that the underlying HTTP connection pool is reused between requests.
+_CLIENT_CACHE = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+
+def _get_client(supabase_url, supabase_key):
+    """Return the cached Supabase client for a URL/key pair, creating it once."""
+    cache_key = (supabase_url, supabase_key)
+    client = _CLIENT_CACHE.get(cache_key)
+    if client is None:
+        with _CLIENT_CACHE_LOCK:
+            client = _CLIENT_CACHE.get(cache_key)
+            if client is None:
+                client = _create_client(supabase_url, supabase_key)
+                _CLIENT_CACHE[cache_key] = client
+    return client
+
+
+# Background upload pools, keyed by worker count, used for background
+# uploads (SUPABASE_ASYNC_UPLOAD and collectstatic). Each pool comes with a
+# semaphore bounding its queued uploads so a burst cannot buffer unlimited
+# file contents in memory; callers block until a slot frees up.
+_EXECUTORS = {}
+_EXECUTOR_LOCK = threading.Lock()
+# In-flight background uploads keyed by (bucket, path).
+_pending = {}
+# Error messages of failed background uploads, keyed by (bucket, path), kept
+# only for storages that report them later (collectstatic's post_process()).
+_failed = {}
+_PENDING_LOCK = threading.Lock()
+
+UPLOAD_RETRIES = 3
+
+BANNER = '*' * 70
+
+# Files larger than this are sent through the resumable (TUS) endpoint.
+MULTIPART_THRESHOLD = 8 * 1024 * 1024
+# Supabase's resumable endpoint requires 6 MB chunks (only the last may be smaller).
+RESUMABLE_CHUNK_SIZE = 6 * 1024 * 1024
+TUS_VERSION = '1.0.0'
+
+# Downloads are buffered in memory up to this size, then spill to disk.
+DOWNLOAD_SPOOL_SIZE = 8 * 1024 * 1024
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Seconds a get_metadata() result is reused before asking Supabase again.
+METADATA_TTL = 5
+# Entries kept per storage instance in the metadata and directory caches;
+# the least recently used entries are evicted beyond these sizes.
+METADATA_CACHE_SIZE = 10000
+DIR_CACHE_SIZE = 256
+# Entries requested per list() call; listings are paginated explicitly.
+LIST_PAGE_SIZE = 1000
+# Maximum number of paths sent in a single remove() call.
+DELETE_BATCH_SIZE = 1000
+
+# Shared httpx client used by supabase-py and by the endpoints it does not
+# wrap. A large keep-alive pool avoids repeating TCP/TLS handshakes for the
+# many small metadata requests a storage backend makes.
+_HTTP_CLIENT = None
+_HTTP_CLIENT_LOCK = threading.Lock()
+HTTP_TIMEOUT = 60.0
+HTTP_MAX_CONNECTIONS = 128
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 64
+HTTP_KEEPALIVE_EXPIRY = 60.0
+
+
+def _clean(name):
+    """Return a file name as str without leading slashes."""
+    if type(name) is not str:
+        name = str(name)
+    if name.startswith('/'):
+        name = name.lstrip('/')
+    return name
+
+
+@lru_cache(maxsize=4096)
+def _build_url(prefix, name):
+    """Join a storage's public URL prefix with a file name, memoized for repeat renders."""
+    return prefix + _clean(name)
+
+
+def _parse_time(value):
+    """Convert a Supabase ISO timestamp to the datetime Django's storage API expects."""
+    if not value:
+        return None
+    parsed = parse_datetime(value)
+    if parsed is not None and not settings.USE_TZ and timezone.is_aware(parsed):
+        # Naive local time, as FileSystemStorage returns, so collectstatic's
+        # modified-time comparison between the two storages is consistent.
+        parsed = timezone.make_naive(parsed)
+    return parsed
+
+
+def _info_metadata(info):
+    """Reshape an object info response like the list() entries the metadata cache holds."""
+    if isinstance(info.get('metadata'), dict) and 'size' in info['metadata']:
+        return info
+    return {
+        'name': info.get('name'),
+        'id': info.get('id'),
+        'created_at': info.get('created_at'),
+        'updated_at': info.get('updated_at') or info.get('last_modified'),
+        'metadata': {
+            'size': info.get('size'),
+            'eTag': info.get('etag'),
+            'mimetype': info.get('content_type'),
+        },
+    }
+
+
+class _LRUCache:
+    """
+    Thread-safe mapping whose entries expire after ttl seconds.
+
+    Beyond max_size entries the least recently used one is evicted, and
+    expired entries are dropped as they are found, so a long-lived storage
+    instance cannot grow without bound.
+    """
+
+    __slots__ = ('ttl', 'max_size', '_entries', '_lock')
+
+    def __init__(self, ttl, max_size):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """Return the value stored for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] >= self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, value, stored_at=None):
+        """Store value for key; stored_at (time.monotonic()) defaults to now."""
+        now = time.monotonic()
+        entries = self._entries
+        with self._lock:
+            entries[key] = (now if stored_at is None else stored_at, value)
+            entries.move_to_end(key)
+            while len(entries) > self.max_size:
+                entries.popitem(last=False)
+            # Least recently used entries come first; drop those that expired.
+            while entries:
+                oldest = next(iter(entries.values()))
+                if now - oldest[0] < self.ttl:
+                    break
+                entries.popitem(last=False)
+
+    def pop(self, key):
+        """Remove key if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+def _is_retryable(error):
+    """Whether a failed request may succeed when sent again: network errors, 5xx and 429."""
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status >= 500 or status == 429
+    return isinstance(error, httpx.TransportError)
+
+
+def _content_type(name):
+    """Guess the MIME type Supabase should serve a file with."""
+    return mimetypes.guess_type(name)[0] or 'application/octet-stream'
+
+
+def _get_executor(workers):
+    """Return the (executor, queue slots) pair for a pool size, creating it on first use."""
+    pool = _EXECUTORS.get(workers)
+    if pool is None:
+        with _EXECUTOR_LOCK:
+            pool = _EXECUTORS.get(workers)
+            if pool is None:
+                queue_size = getattr(settings, 'SUPABASE_UPLOAD_QUEUE_SIZE', None) or workers * 4
+                pool = (
+                    ThreadPoolExecutor(max_workers=workers, thread_name_prefix='supabase-upload'),
+                    threading.BoundedSemaphore(queue_size),
+                )
+                _EXECUTORS[workers] = pool
+    return pool
+
+
+def _get_http_client():
+    """Return the shared httpx client, creating it on first use."""
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None:
+        with _HTTP_CLIENT_LOCK:
+            if _HTTP_CLIENT is None:
+                _HTTP_CLIENT = httpx.Client(
+                    timeout=HTTP_TIMEOUT,
+                    limits=httpx.Limits(
+                        max_connections=HTTP_MAX_CONNECTIONS,
+                        max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                        keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+                    ),
+                    http2=HTTP2_AVAILABLE,
+                    follow_redirects=True,
+                )
+    return _HTTP_CLIENT
+
+
+def _create_client(supabase_url, supabase_key):
+    """Create a Supabase client that sends its requests through the shared httpx client."""
+    if ClientOptions is not None:
+        try:
+            options = ClientOptions(httpx_client=_get_http_client())
+        except TypeError:
+            # supabase-py releases before httpx_client support
+            options = None
+        if options is not None:
+            return create_client(supabase_url, supabase_key, options)
+    return create_client(supabase_url, supabase_key)
 
 
 class SupabaseStorage(Storage):
@@ -33,15 +295,33 @@ class SupabaseStorage(Storage):
     """
     folder_path=''
 
-    def __init__(self):
-        """Initialize Supabase client."""
-        # Get settings
-        self.supabase_url = getattr(settings, 'SUPABASE_URL', None)
-        self.supabase_key = getattr(settings, 'SUPABASE_KEY', None)
-        self.bucket_name = getattr(settings, 'SUPABASE_BUCKET', 'media')
+    # Instance state lives in slots for faster attribute access. Django's
+    # Storage base class has no __slots__, so instances keep a __dict__ and
+    # subclasses may still add their own attributes.
+    __slots__ = (
+        'supabase_url', 'supabase_key', '_bucket_id', 'cache_control',
+        'async_upload', 'upload_workers', 'multipart_threshold', 'metadata_ttl',
+        'client', '_bucket', '_meta_cache', '_dir_cache', '_delete_batch',
+        '_headers', '_storage_url', '_resumable_url', '_object_url', '_info_url',
+        '_path_prefix', '_url_prefix',
+    )
+
+    # Whether failed background uploads are recorded for wait_pending() and
+    # post_process(); otherwise they are only logged.
+    _keep_failed_uploads = False
+
+    # Settings are read and validated once per class by _load_settings()
+    # and reset when a SUPABASE_* setting changes (e.g. override_settings).
+    _configured = False
+
+    @classmethod
+    def _load_settings(cls):
+        """Read and validate the Supabase settings, caching them on the class."""
+        supabase_url = getattr(settings, 'SUPABASE_URL', None)
+        supabase_key = getattr(settings, 'SUPABASE_KEY', None)
 
         # Validate required settings
-        if not self.supabase_url:
+        if not supabase_url:
             error_msg = (
                 "SUPABASE_URL is not configured!\n"
                 "Add to your .env file:\n"
@@ -50,7 +330,7 @@ class SupabaseStorage(Storage):
             logger.error(error_msg)
             raise ValueError(error_msg)
         
-        if not self.supabase_key:
+        if not supabase_key:
             error_msg = (
                 "SUPABASE_KEY is not configured!\n"
                 "Add to your .env file:\n"
@@ -58,6 +338,33 @@ class SupabaseStorage(Storage):
             )
             logger.error(error_msg)
             raise ValueError(error_msg)
+
+        cls._supabase_url = supabase_url
+        cls._supabase_key = supabase_key
+        cls._bucket_name = getattr(settings, 'SUPABASE_BUCKET', 'media')
+        # Seconds browsers and the CDN may cache uploaded files
+        cls._cache_control = str(getattr(settings, 'SUPABASE_CACHE_CONTROL', '3600'))
+        cls._async_upload = getattr(settings, 'SUPABASE_ASYNC_UPLOAD', False)
+        cls._upload_workers = getattr(settings, 'SUPABASE_UPLOAD_WORKERS', None) or 8
+        cls._multipart_threshold = getattr(
+            settings, 'SUPABASE_MULTIPART_THRESHOLD', MULTIPART_THRESHOLD
+        )
+        cls._metadata_ttl = getattr(settings, 'SUPABASE_METADATA_TTL', METADATA_TTL)
+        cls._configured = True
+
+    def __init__(self):
+        """Initialize Supabase client."""
+        # Get settings, read once per class
+        cls = type(self)
+        if not cls.__dict__.get('_configured', False):
+            cls._load_settings()
+        self.supabase_url = cls._supabase_url
+        self.supabase_key = cls._supabase_key
+        self.cache_control = cls._cache_control
+        self.async_upload = cls._async_upload
+        self.upload_workers = cls._upload_workers
+        self.multipart_threshold = cls._multipart_threshold
+        self.metadata_ttl = cls._metadata_ttl
         
         # Create Supabase client
         if create_client is None:
@@ -69,13 +376,53 @@ class SupabaseStorage(Storage):
             raise ImportError(error_msg)
         
         try:
-            self.client = create_client(self.supabase_url, self.supabase_key)
+            self.client = _get_client(self.supabase_url, self.supabase_key)
             logger.info("✓ Supabase client initialized successfully")
         except Exception as e:
             error_msg = f"Failed to create Supabase client: {str(e)}"
             logger.error(error_msg)
             raise ValueError(error_msg)
 
+        # object path -> metadata, see _get_metadata()
+        self._meta_cache = _LRUCache(self.metadata_ttl, METADATA_CACHE_SIZE)
+        # directory -> listed_at, see _prefetch_dir()
+        self._dir_cache = _LRUCache(self.metadata_ttl, DIR_CACHE_SIZE)
+        # Per-thread buffer of names collected by batched_deletes()
+        self._delete_batch = threading.local()
+
+        self._headers = {
+            "Authorization": f"Bearer {self.supabase_key}",
+            "apikey": self.supabase_key,
+        }
+        self._storage_url = f"{self.supabase_url.rstrip('/')}/storage/v1"
+        self._resumable_url = f"{self._storage_url}/upload/resumable"
+        # Prepended to every file name to get its object path in the bucket
+        folder = self.folder_path.strip('/') if self.folder_path else ''
+        self._path_prefix = f"{folder}/" if folder else ''
+
+        self._set_bucket(cls._bucket_name)
+
+    @property
+    def bucket_name(self):
+        """Name of the bucket files are stored in."""
+        return self._bucket_id
+
+    @bucket_name.setter
+    def bucket_name(self, bucket_name):
+        # Subclasses may switch buckets after __init__(); keep the memoized
+        # proxy and URLs pointing at the same bucket.
+        self._set_bucket(bucket_name)
+
+    def _set_bucket(self, bucket_name):
+        """Point the storage at a bucket and memoize its file API proxy and URLs."""
+        self._bucket_id = bucket_name
+        self._bucket = self.client.storage.from_(bucket_name)
+        self._object_url = f"{self._storage_url}/object/{bucket_name}"
+        self._info_url = f"{self._storage_url}/object/info/{bucket_name}"
+        self._url_prefix = (
+            f"{self._storage_url}/object/public/{bucket_name}/{self._path_prefix}"
+        )
+
     def _save(self, name, content):
         """
         SAVE FILE TO SUPABASE ONLY - NEVER LOCALLY
@@ -95,55 +442,75 @@ class SupabaseStorage(Storage):
 
         # Clean the path
         original_name = name
-        name = str(name).lstrip('/')
+        name = _clean(name)
         
-        logger.info(f"\n{'*' * 70}")
-        logger.info(f"FILE SAVE REQUEST TO SUPABASE")
-        logger.info(f"{'*' * 70}")
-        logger.info(f"Original name: {original_name}")
-        logger.info(f"Cleaned name: {name}")
-        logger.info(f"Bucket: {self.bucket_name}")
-        logger.info(f"Folder Path: {self.folder_path}")
-        # Read file content
+        verbose = logger.isEnabledFor(logging.INFO)
+        if verbose:
+            logger.info("\n%s", BANNER)
+            logger.info("FILE SAVE REQUEST TO SUPABASE")
+            logger.info(BANNER)
+            logger.info("Original name: %s", original_name)
+            logger.info("Cleaned name: %s", name)
+            logger.info("Bucket: %s", self.bucket_name)
+            logger.info("Folder Path: %s", self.folder_path)
+        # Size the file without pulling it into memory; only files below
+        # the multipart threshold are read in full.
         try:
-            if hasattr(content, 'read'):
+            file_size = self._content_size(content)
+            logger.info("File size: %s bytes", file_size)
+            
+            if not file_size:
+                error_msg = f"File is empty: {name}"
+                logger.error(error_msg)
+                raise ValueError(error_msg)
+
+            streamed = file_size > self.multipart_threshold
+            if streamed:
+                logger.debug("Large file, streaming in chunks...")
+                file_content = content if hasattr(content, 'read') else BytesIO(content)
+                self._rewind(file_content)
+            elif hasattr(content, 'read'):
                 logger.debug("Content is file-like object, reading...")
+                self._rewind(content)
                 file_content = content.read()
             else:
                 logger.debug("Content is bytes, using directly...")
                 file_content = content
-            
-            file_size = len(file_content) if file_content else 0
-            logger.info(f"File size: {file_size} bytes")
-            
-            if not file_content:
-                error_msg = f"File is empty: {name}"
-                logger.error(error_msg)
-                raise ValueError(error_msg)
                 
-        except Exception as e:
+        except (OSError, ValueError) as e:
             error_msg = f"Failed to read file content: {str(e)}"
             logger.error(error_msg)
             raise IOError(error_msg)
 
+        path = self._path_prefix + name
+
+        self._forget(path)
+
+        # Streamed uploads read from the caller's file, which may be closed
+        # once the request ends, so they always run inline.
+        if not streamed and self.async_upload:
+            self._submit_upload(path, file_content)
+            logger.info("Queued background upload: %s/%s", self.bucket_name, path)
+            return name
+
         # Upload to Supabase ONLY
         try:
-            logger.info(f"Uploading to Supabase: {self.bucket_name}/{self.folder_path}/{name}")
-            
-            response = self.client.storage.from_(self.bucket_name).upload(
-                path=f"{self.folder_path}/{name}",
-                file=file_content,
-                file_options={"upsert": "true"}
-            )
+            logger.info("Uploading to Supabase: %s/%s", self.bucket_name, path)
+
+            if streamed:
+                response = self._upload_resumable(path, file_content, file_size)
+            else:
+                response = self._upload_with_retry(path, file_content)
 
-            logger.info(f"✓ UPLOAD SUCCESSFUL")
-            logger.info(f"  Path: {self.bucket_name}/{self.folder_path}/{name}")
-            logger.info(f"  Response: {response}")
-            logger.info(f"{'*' * 70}\n")
+            if verbose:
+                logger.info("✓ UPLOAD SUCCESSFUL")
+                logger.info("  Path: %s/%s", self.bucket_name, path)
+                logger.info("  Response: %s", response)
+                logger.info("%s\n", BANNER)
             
             return name
 
-        except Exception as e:
+        except REQUEST_ERRORS + (OSError, ValueError) as e:
             error_msg = (
                 f"UPLOAD TO SUPABASE FAILED!\n"
                 f"Error: {str(e)}\n"
@@ -151,9 +518,380 @@ class SupabaseStorage(Storage):
                 f"Bucket: {self.bucket_name}"
             )
             logger.error(error_msg)
-            logger.exception("Full traceback:")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Full traceback:", exc_info=True)
             raise IOError(error_msg)
 
+    @staticmethod
+    def _content_size(content):
+        """Return the size of bytes or a file-like object without reading it."""
+        if not hasattr(content, 'read'):
+            return len(content) if content else 0
+        size = getattr(content, 'size', None)
+        if size is None:
+            position = content.tell()
+            size = content.seek(0, 2)
+            content.seek(position)
+        return size
+
+    @staticmethod
+    def _rewind(content):
+        """Seek a file-like object back to its start when it supports seeking."""
+        try:
+            content.seek(0)
+        except (AttributeError, OSError):
+            pass
+
+    def _upload_with_retry(self, path, data):
+        """
+        Upload bytes to the bucket, retrying with exponential backoff.
+
+        The body is POSTed straight to the object endpoint on the shared
+        httpx client rather than through supabase-py's multipart form upload.
+        Only network errors, 5xx responses and 429 are retried; other client
+        errors (auth, size limits, conflicts) fail immediately.
+
+        Args:
+            path: Object path inside the bucket
+            data: File content as bytes
+
+        Returns:
+            The Supabase upload response
+        """
+        http = _get_http_client()
+        url = f"{self._object_url}/{quote(path)}"
+        headers = {
+            **self._headers,
+            "Content-Type": _content_type(path),
+            "cache-control": f"max-age={self.cache_control}",
+            "x-upsert": "true",
+        }
+        for attempt in range(UPLOAD_RETRIES):
+            try:
+                response = http.post(url, content=data, headers=headers)
+                response.raise_for_status()
+                return response.json()
+            except REQUEST_ERRORS as e:
+                if attempt == UPLOAD_RETRIES - 1 or not _is_retryable(e):
+                    raise
+                delay = 2 ** attempt
+                logger.warning(
+                    "Upload of %s/%s failed (%s), retrying in %ss",
+                    self.bucket_name, path, e, delay,
+                )
+                time.sleep(delay)
+
+    def _upload_resumable(self, path, stream, total):
+        """
+        Upload a large file in chunks through Supabase's resumable (TUS) endpoint.
+
+        Chunks are read from the stream one at a time, so memory use stays at
+        one chunk regardless of file size. TUS requires chunks to be sent in
+        order, so each chunk is retried on its own and resumes from the
+        offset the server reports.
+
+        Args:
+            path: Object path inside the bucket
+            stream: Readable file-like object positioned at the start
+            total: Size of the file in bytes
+
+        Returns:
+            The upload URL of the completed resource
+        """
+        http = _get_http_client()
+        metadata = {
+            'bucketName': self.bucket_name,
+            'objectName': path,
+            'contentType': _content_type(path),
+            'cacheControl': self.cache_control,
+        }
+        tus_headers = {**self._headers, 'Tus-Resumable': TUS_VERSION}
+
+        response = http.post(
+            self._resumable_url,
+            headers={
+                **tus_headers,
+                'Upload-Length': str(total),
+                'Upload-Metadata': ','.join(
+                    f"{key} {base64.b64encode(value.encode()).decode()}"
+                    for key, value in metadata.items()
+                ),
+                'x-upsert': 'true',
+            },
+        )
+        response.raise_for_status()
+        location = response.headers.get('Location')
+        if not location:
+            raise IOError(f"Supabase did not return an upload URL for {path}")
+        location = urljoin(self._resumable_url, location)
+
+        # One reusable chunk buffer that file-like objects read straight into;
+        # a chunk is only copied out to bytes when it is handed to httpx.
+        buffer = bytearray(RESUMABLE_CHUNK_SIZE)
+        view = memoryview(buffer)
+        readinto = getattr(stream, 'readinto', None)
+
+        offset = 0
+        attempt = 0
+        # Set after a failed request; the next iteration asks the server how
+        # much it has stored before sending any more data.
+        resync = False
+        while offset < total:
+            try:
+                if resync:
+                    head = http.head(location, headers=tus_headers)
+                    head.raise_for_status()
+                    stored = head.headers.get('Upload-Offset')
+                    if stored is None:
+                        raise IOError(f"Supabase did not report an offset for {path}")
+                    offset = int(stored)
+                    stream.seek(offset)
+                    resync = False
+                    continue
+
+                if readinto is not None:
+                    size = readinto(view)
+                else:
+                    data = stream.read(RESUMABLE_CHUNK_SIZE)
+                    size = len(data)
+                    view[:size] = data
+                if not size:
+                    raise IOError(f"File ended at {offset} of {total} bytes")
+
+                response = http.patch(
+                    location,
+                    content=bytes(view[:size]),
+                    headers={
+                        **tus_headers,
+                        'Upload-Offset': str(offset),
+                        'Content-Type': 'application/offset+octet-stream',
+                    },
+                )
+                response.raise_for_status()
+                accepted = int(response.headers.get('Upload-Offset', offset + size))
+                if accepted != offset + size:
+                    stream.seek(accepted)
+                offset = accepted
+                attempt = 0
+            except REQUEST_ERRORS as e:
+                attempt += 1
+                if attempt == UPLOAD_RETRIES or not _is_retryable(e):
+                    raise
+                delay = 2 ** (attempt - 1)
+                logger.warning(
+                    "Chunk at offset %s of %s/%s failed (%s), resuming in %ss",
+                    offset, self.bucket_name, path, e, delay,
+                )
+                time.sleep(delay)
+                resync = True
+
+        logger.debug("Resumable upload complete: %s/%s (%s bytes)", self.bucket_name, path, total)
+        return location
+
+    def _submit_upload(self, path, data):
+        """Queue an upload on the shared executor and track it as pending."""
+        executor, slots = _get_executor(self.upload_workers)
+        key = (self.bucket_name, path)
+        slots.acquire()
+        try:
+            future = executor.submit(self._background_upload, key, path, data)
+        except Exception:
+            slots.release()
+            raise
+
+        with _PENDING_LOCK:
+            _pending[key] = future
+
+        def _done(finished):
+            slots.release()
+            with _PENDING_LOCK:
+                if _pending.get(key) is finished:
+                    del _pending[key]
+
+        future.add_done_callback(_done)
+        return future
+
+    def _background_upload(self, key, path, data):
+        """
+        Run an upload on a worker thread, logging a failure instead of raising it.
+
+        A raised error would keep its traceback, and with it the file content,
+        alive in the future for as long as the future is referenced. Storages
+        that report failures later (see _keep_failed_uploads) record only the
+        error message.
+        """
+        try:
+            self._upload_with_retry(path, data)
+        except Exception as e:  # nothing above this frame would handle it
+            logger.error("Background upload to %s/%s failed: %s", key[0], key[1], e)
+            if self._keep_failed_uploads:
+                with _PENDING_LOCK:
+                    _failed[key] = str(e)
+
+    def _pop_failures(self, keys):
+        """Remove and return the recorded failures for (bucket, path) keys."""
+        with _PENDING_LOCK:
+            return [(key, _failed.pop(key)) for key in keys if key in _failed]
+
+    def wait_pending(self, name=None):
+        """
+        Block until background uploads have finished.
+
+        Failed uploads are logged. Storages that keep failures for
+        post_process() also re-raise the first one here as IOError.
+
+        Args:
+            name: Only wait for this file; waits for every upload of this
+                bucket when omitted
+        """
+        with _PENDING_LOCK:
+            if name is None:
+                futures = [f for key, f in _pending.items() if key[0] == self.bucket_name]
+            else:
+                name = _clean(name)
+                future = _pending.get((self.bucket_name, self._path_prefix + name))
+                futures = [future] if future is not None else []
+        wait(futures)
+
+        with _PENDING_LOCK:
+            if name is None:
+                keys = [key for key in _failed if key[0] == self.bucket_name]
+            else:
+                keys = [(self.bucket_name, self._path_prefix + name)]
+        failures = self._pop_failures(keys)
+        if failures:
+            (bucket, path), error = failures[0]
+            raise IOError(f"Background upload to {bucket}/{path} failed: {error}")
+
+    def _get_metadata(self, name):
+        """
+        Fetch object metadata, reusing a cached result for SUPABASE_METADATA_TTL seconds.
+
+        Django often calls exists(), size() and the time getters back to back
+        for the same file, and for many siblings in a row during a directory
+        scan. A cache miss lists the first page of the parent directory once,
+        which answers most siblings' lookups from a single request. Missing
+        files are not cached.
+
+        Args:
+            name: Object path inside the bucket
+
+        Returns:
+            Metadata dict shaped like a list() entry, or None if the file
+            does not exist
+        """
+        self._settle(name)
+        metadata = self._cached_metadata(name)
+        if metadata is not None:
+            return metadata
+
+        response = _get_http_client().get(
+            f"{self._info_url}/{quote(name)}",
+            headers=self._headers,
+        )
+        # Older Storage API versions report a missing object as 400
+        if response.status_code in (400, 404):
+            return None
+        response.raise_for_status()
+
+        metadata = _info_metadata(response.json())
+        self._meta_cache.set(name, metadata)
+        return metadata
+
+    def _settle(self, name):
+        """
+        Wait for a background upload of a file, so lookups see its outcome.
+
+        Does not raise for a failed upload; lookups then find the file
+        missing, and wait_pending() or post_process() report the failure.
+
+        Args:
+            name: Object path inside the bucket
+        """
+        future = _pending.get((self.bucket_name, name))
+        if future is not None:
+            wait([future])
+
+    def _cached_metadata(self, name):
+        """
+        Answer a metadata lookup from the cache, prefetching the parent on a miss.
+
+        Only files seen in a listing are answered. A file missing from the
+        cache may have been uploaded by another process since the listing,
+        so callers must confirm a miss with a request for the file itself.
+
+        Args:
+            name: Object path inside the bucket
+
+        Returns:
+            Cached metadata dict, or None when the cache cannot tell
+        """
+        metadata = self._meta_cache.get(name)
+        if metadata is not None:
+            return metadata
+        # With caching disabled a listing would be thrown away unread
+        if self.metadata_ttl <= 0:
+            return None
+
+        parent = name.rpartition('/')[0]
+        try:
+            self._prefetch_dir(parent)
+        except REQUEST_ERRORS as e:
+            logger.debug("Could not prefetch directory %s: %s", parent, e)
+            return None
+
+        return self._meta_cache.get(name)
+
+    def _prefetch_dir(self, parent):
+        """
+        Cache the metadata of the files on the first page of a directory listing.
+
+        A directory is listed at most once per SUPABASE_METADATA_TTL seconds.
+
+        Args:
+            parent: Directory path inside the bucket ('' for the root)
+        """
+        if self._dir_cache.get(parent) is not None:
+            return
+
+        listed_at = time.monotonic()
+        page = self._bucket.list(path=parent, options={'limit': LIST_PAGE_SIZE, 'offset': 0})
+        self._remember(parent, page, listed_at)
+
+    def _remember(self, parent, items, listed_at):
+        """Cache the metadata of the files in a directory listing."""
+        self._dir_cache.set(parent, listed_at, listed_at)
+        meta_cache = self._meta_cache
+        prefix = f"{parent}/" if parent else ''
+        for item in items:
+            if item.get('id') is not None:
+                meta_cache.set(prefix + item['name'], item, listed_at)
+
+    def _list_dir(self, path):
+        """
+        List a whole directory page by page.
+
+        Args:
+            path: Directory path inside the bucket ('' for the root)
+
+        Returns:
+            List of entries as returned by Supabase
+        """
+        bucket = self._bucket
+        items = []
+        while True:
+            page = bucket.list(
+                path=path,
+                options={'limit': LIST_PAGE_SIZE, 'offset': len(items)},
+            )
+            items.extend(page)
+            if len(page) < LIST_PAGE_SIZE:
+                return items
+
+    def _forget(self, name):
+        """Drop cached metadata for a file."""
+        self._meta_cache.pop(name)
+
     def _open(self, name, mode='rb'):
         """
         Open/download a file from Supabase.
@@ -163,19 +901,35 @@ class SupabaseStorage(Storage):
             mode: File mode (ignored)
             
         Returns:
-            BytesIO object with file content
+            File-like object with the file content, kept in memory up to
+            DOWNLOAD_SPOOL_SIZE and spilled to a temporary file beyond that
         """
-        name = str(name).lstrip('/')
-        logger.info(f"Opening file from Supabase: {self.bucket_name}/{name}")
+        name = _clean(name)
+        logger.info("Opening file from Supabase: %s/%s", self.bucket_name, name)
+        path = self._path_prefix + name
+        self._settle(path)
 
+        spooled = SpooledTemporaryFile(max_size=DOWNLOAD_SPOOL_SIZE)
         try:
-            data = self.client.storage.from_(self.bucket_name).download(name)
-            logger.info(f"✓ File opened: {name}")
-            return BytesIO(data)
-        except Exception as e:
+            with _get_http_client().stream(
+                'GET', f"{self._object_url}/{quote(path)}",
+                headers=self._headers,
+            ) as response:
+                response.raise_for_status()
+                for chunk in response.iter_bytes(DOWNLOAD_CHUNK_SIZE):
+                    spooled.write(chunk)
+            spooled.seek(0)
+            logger.info("✓ File opened: %s", name)
+            return spooled
+        except REQUEST_ERRORS as e:
+            spooled.close()
             error_msg = f"Failed to download {name}: {str(e)}"
             logger.error(error_msg)
             raise FileNotFoundError(error_msg)
+        except BaseException:
+            # e.g. the disk filling up while spilling to a temporary file
+            spooled.close()
+            raise
 
     def delete(self, name):
         """
@@ -187,14 +941,74 @@ class SupabaseStorage(Storage):
         if not name:
             return
 
-        name = str(name).lstrip('/')
-        logger.info(f"Deleting from Supabase: {self.bucket_name}/{name}")
+        name = _clean(name)
+
+        batch = getattr(self._delete_batch, 'names', None)
+        if batch is not None:
+            batch.append(name)
+            return
+
+        path = self._path_prefix + name
+        # Deleting before a background upload lands would let it recreate the file
+        self._settle(path)
+        self._forget(path)
+
+        logger.info("Deleting from Supabase: %s/%s", self.bucket_name, path)
 
         try:
-            self.client.storage.from_(self.bucket_name).remove([name])
-            logger.info(f"✓ Deleted: {name}")
-        except Exception as e:
-            logger.warning(f"Could not delete {name}: {str(e)}")
+            self._bucket.remove([path])
+            logger.info("✓ Deleted: %s", name)
+        except REQUEST_ERRORS as e:
+            logger.warning("Could not delete %s: %s", name, e)
+
+    def bulk_delete(self, names):
+        """
+        Delete many files, sending up to DELETE_BATCH_SIZE paths per request.
+
+        Args:
+            names: Iterable of file paths in Supabase
+        """
+        prefix = self._path_prefix
+        paths = [prefix + _clean(name) for name in names if name]
+        settle = self._settle
+        forget = self._forget
+        for path in paths:
+            settle(path)
+            forget(path)
+
+        bucket = self._bucket
+        for start in range(0, len(paths), DELETE_BATCH_SIZE):
+            chunk = paths[start:start + DELETE_BATCH_SIZE]
+            logger.info("Deleting %s files from Supabase: %s", len(chunk), self.bucket_name)
+            try:
+                bucket.remove(chunk)
+                logger.info("✓ Deleted %s files", len(chunk))
+            except REQUEST_ERRORS as e:
+                logger.warning("Could not delete %s files: %s", len(chunk), e)
+
+    @contextmanager
+    def batched_deletes(self):
+        """
+        Collect delete() calls made in this thread and send them in bulk on exit.
+
+        Usage:
+            with storage.batched_deletes():
+                for name in stale_files:
+                    storage.delete(name)
+
+        Nested blocks join the outermost batch.
+        """
+        if getattr(self._delete_batch, 'names', None) is not None:
+            yield
+            return
+
+        self._delete_batch.names = []
+        try:
+            yield
+        finally:
+            names = self._delete_batch.names
+            self._delete_batch.names = None
+            self.bulk_delete(names)
 
     def exists(self, name):
         """
@@ -209,13 +1023,22 @@ class SupabaseStorage(Storage):
         if not name:
             return False
 
-        name = str(name).lstrip('/')
+        name = _clean(name)
 
-        try:
-            self.client.storage.from_(self.bucket_name).get_metadata(name)
+        path = self._path_prefix + name
+        # Answer for the uploaded file, as size() and the time getters do
+        self._settle(path)
+        if self._cached_metadata(path) is not None:
             return True
-        except Exception:
-            return False
+
+        # A name missing from the cache may still exist, and
+        # get_available_name() relies on this answer before an upsert, so a
+        # miss is always confirmed live. A HEAD request answers without a
+        # response body and without turning a missing file into an exception.
+        response = _get_http_client().head(
+            f"{self._object_url}/{quote(path)}", headers=self._headers
+        )
+        return response.status_code == 200
 
     def listdir(self, path):
         """
@@ -227,22 +1050,27 @@ class SupabaseStorage(Storage):
         Returns:
             (directories, files) tuple
         """
-        path = str(path).lstrip('/') if path else ''
+        path = _clean(path).rstrip('/') if path else ''
 
         try:
-            response = self.client.storage.from_(self.bucket_name).list(path=path)
+            directory = (self._path_prefix + path).rstrip('/')
+            listed_at = time.monotonic()
+            items = self._list_dir(directory)
+            self._remember(directory, items, listed_at)
+
             dirs = []
             files = []
-
-            for item in response:
+            add_dir = dirs.append
+            add_file = files.append
+            for item in items:
                 if item.get('id') is None:
-                    dirs.append(item['name'])
+                    add_dir(item['name'])
                 else:
-                    files.append(item['name'])
+                    add_file(item['name'])
 
             return dirs, files
-        except Exception as e:
-            logger.warning(f"Could not list directory {path}: {str(e)}")
+        except REQUEST_ERRORS as e:
+            logger.warning("Could not list directory %s: %s", path, e)
             return [], []
 
     def size(self, name):
@@ -258,14 +1086,15 @@ class SupabaseStorage(Storage):
         if not name:
             return 0
 
-        name = str(name).lstrip('/')
+        name = _clean(name)
 
         try:
-            metadata = self.client.storage.from_(self.bucket_name).get_metadata(name)
-            size = metadata.get('metadata', {}).get('size', 0)
-            return size
-        except Exception:
+            metadata = self._get_metadata(self._path_prefix + name)
+        except REQUEST_ERRORS:
             return 0
+        if metadata is None:
+            return 0
+        return (metadata.get('metadata') or {}).get('size') or 0
 
     def url(self, name):
         """
@@ -280,11 +1109,51 @@ class SupabaseStorage(Storage):
         if not name:
             return ''
 
-        name = str(name).lstrip('/')
+        return _build_url(self._url_prefix, name)
+
+    def urls_bulk(self, names):
+        """
+        Get public URLs for many files at once.
+
+        Args:
+            names: Iterable of file paths in Supabase
+
+        Returns:
+            List of public URLs in the same order ('' for empty names)
+        """
+        prefix = self._url_prefix
+        return [_build_url(prefix, name) if name else '' for name in names]
+
+    def create_signed_upload_url(self, name):
+        """
+        Create a URL a client can upload a file to directly, bypassing Django.
 
-        # Construct the public URL
-        url = f"{self.supabase_url}/storage/v1/object/public/{self.bucket_name}/{self.folder_path}/{name}"
-        return url
+        The client sends the file with a PUT to the returned signed_url.
+        Supabase keeps signed upload URLs valid for two hours.
+
+        Args:
+            name: File path in Supabase
+
+        Returns:
+            Dict with the signed_url, its token and the storage name to
+            store on the model once the upload has finished
+        """
+        name = _clean(name)
+        path = self._path_prefix + name
+        self._forget(path)
+
+        try:
+            signed = self._bucket.create_signed_upload_url(path)
+        except REQUEST_ERRORS as e:
+            error_msg = f"Could not create signed upload URL for {name}: {e}"
+            logger.error(error_msg)
+            raise IOError(error_msg) from e
+
+        return {
+            'signed_url': signed['signed_url'],
+            'token': signed['token'],
+            'name': name,
+        }
 
     def get_accessed_time(self, name):
         """Get file access time."""
@@ -295,26 +1164,31 @@ class SupabaseStorage(Storage):
         if not name:
             return None
 
-        name = str(name).lstrip('/')
+        name = _clean(name)
 
         try:
-            metadata = self.client.storage.from_(self.bucket_name).get_metadata(name)
-            return metadata.get('created_at')
-        except Exception:
+            metadata = self._get_metadata(self._path_prefix + name)
+        except REQUEST_ERRORS as e:
+            raise OSError(f"Could not read metadata of {name}: {e}") from e
+        if metadata is None:
             return None
+        return _parse_time(metadata.get('created_at'))
 
     def get_modified_time(self, name):
         """Get file modification time."""
         if not name:
             return None
 
-        name = str(name).lstrip('/')
+        name = _clean(name)
 
         try:
-            metadata = self.client.storage.from_(self.bucket_name).get_metadata(name)
-            return metadata.get('updated_at')
-        except Exception:
+            metadata = self._get_metadata(self._path_prefix + name)
+        except REQUEST_ERRORS as e:
+            # collectstatic only treats OSError as "cannot tell" and recopies
+            raise OSError(f"Could not read metadata of {name}: {e}") from e
+        if metadata is None:
             return None
+        return _parse_time(metadata.get('updated_at'))
 
 
 class SupabaseMediaStorage(SupabaseStorage):
@@ -323,16 +1197,22 @@ class SupabaseMediaStorage(SupabaseStorage):
     
     All user uploads go to the 'media' bucket in Supabase.
     """
+    __slots__ = ()
+
     folder_path = 'media'
 
-    def __init__(self):
-        super().__init__()
-        self.bucket_name = getattr(
+    @classmethod
+    def _load_settings(cls):
+        super()._load_settings()
+        cls._bucket_name = getattr(
             settings,
             'SUPABASE_MEDIA_BUCKET',
-            getattr(settings, 'SUPABASE_BUCKET', self.bucket_name or 'media'),
+            getattr(settings, 'SUPABASE_BUCKET', cls._bucket_name or 'media'),
         )
-        logger.info(f"✓ SupabaseMediaStorage initialized for Media bucket")
+
+    def __init__(self):
+        super().__init__()
+        logger.info("✓ SupabaseMediaStorage initialized for Media bucket")
 
 
 class SupabaseStaticStorage(SupabaseStorage):
@@ -341,13 +1221,67 @@ class SupabaseStaticStorage(SupabaseStorage):
     
     All static files go to the 'static' bucket in Supabase.
     """
+    __slots__ = ()
+
     folder_path='static'
 
-    def __init__(self):
-        super().__init__()
-        self.bucket_name = getattr(
+    # post_process() reports failed background uploads to collectstatic
+    _keep_failed_uploads = True
+
+    @classmethod
+    def _load_settings(cls):
+        super()._load_settings()
+        cls._bucket_name = getattr(
             settings,
             'SUPABASE_STATIC_BUCKET',
-            getattr(settings, 'SUPABASE_BUCKET', self.bucket_name or 'static'),
+            getattr(settings, 'SUPABASE_BUCKET', cls._bucket_name or 'static'),
         )
-        logger.info(f"✓ SupabaseStaticStorage initialized for Static bucket")
+        cls._cache_control = str(getattr(
+            settings, 'SUPABASE_STATIC_CACHE_CONTROL', cls._cache_control
+        ))
+        # collectstatic saves files one at a time; uploading them in the
+        # background lets post_process() wait for them all in parallel.
+        # Opt-in, because failures then only surface in post_process().
+        cls._async_upload = getattr(settings, 'SUPABASE_STATIC_ASYNC_UPLOAD', False)
+        cls._upload_workers = getattr(settings, 'SUPABASE_COLLECTSTATIC_WORKERS', None) or 32
+
+    def __init__(self):
+        super().__init__()
+        logger.info("✓ SupabaseStaticStorage initialized for Static bucket")
+
+    def post_process(self, paths, dry_run=False, **options):
+        """
+        Wait for the background uploads started by collectstatic.
+
+        Called by collectstatic once every file has been saved. Files were
+        uploaded unchanged, so only failed uploads are yielded, each with its
+        exception, which makes collectstatic abort with that error.
+
+        Args:
+            paths: Dict of collected paths, as passed by collectstatic
+            dry_run: Nothing was uploaded, so there is nothing to wait for
+        """
+        if dry_run:
+            return
+
+        prefix = self._path_prefix
+        names = {(self.bucket_name, prefix + _clean(name)): name for name in paths}
+        with _PENDING_LOCK:
+            futures = [_pending[key] for key in names if key in _pending]
+        wait(futures)
+
+        for key, error in self._pop_failures(names):
+            name = names[key]
+            yield name, None, IOError(f"Upload of {name} to Supabase failed: {error}")
+
+
+@receiver(setting_changed)
+def _reset_storage_settings(setting, **kwargs):
+    """Make storage classes re-read their settings after a SUPABASE_* change."""
+    if not setting.startswith('SUPABASE_'):
+        return
+    classes = [SupabaseStorage]
+    while classes:
+        cls = classes.pop()
+        cls._configured = False
+        classes.extend(cls.__subclasses__())
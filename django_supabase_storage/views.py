@@ -0,0 +1,39 @@
+"""
+Views for uploading files from the browser straight to Supabase.
+"""
+
+from django.contrib.auth.decorators import login_required
+from django.core.files.storage import default_storage
+from django.http import JsonResponse
+from django.views.decorators.http import require_POST
+
+
+@login_required
+@require_POST
+def signed_upload_url(request):
+    """
+    Return a signed upload URL for the file name posted as ``name``.
+
+    The name is passed through the default storage's generate_filename()
+    and get_available_name(), so clients cannot pick unsafe paths or
+    overwrite existing files. Save the returned name on the model once the
+    client has uploaded the file.
+    """
+    name = request.POST.get('name', '')
+    if not name:
+        return JsonResponse({'error': 'A file name is required.'}, status=400)
+
+    if not hasattr(default_storage, 'create_signed_upload_url'):
+        return JsonResponse(
+            {'error': 'The default storage does not support signed uploads.'},
+            status=501,
+        )
+
+    name = default_storage.get_available_name(default_storage.generate_filename(name))
+
+    try:
+        signed = default_storage.create_signed_upload_url(name)
+    except IOError as e:
+        return JsonResponse({'error': str(e)}, status=502)
+
+    return JsonResponse(signed)
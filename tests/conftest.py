@@ -0,0 +1,173 @@
+"""
+Shared fixtures: an in-memory Supabase Storage API served through httpx.MockTransport.
+"""
+
+import json
+import re
+import threading
+from urllib.parse import unquote
+
+import httpx
+import pytest
+from django.core.files.storage import default_storage, storages
+from django.utils.functional import empty
+
+from django_supabase_storage import storage_backends
+
+
+class FakeSupabase:
+    """
+    Minimal Supabase Storage API keeping each bucket's objects in a dict.
+
+    Every request is recorded in ``requests`` as (method, path). Tests queue
+    failures with ``fail(method, path_fragment, status)``; a status of None
+    raises a connection error instead of responding. ``hold(method,
+    path_fragment)`` returns an Event that matching requests wait for, which
+    keeps background uploads pending while a test inspects the storage.
+    """
+
+    OBJECT_PATH = re.compile(r'/storage/v1/object/(?:(list|info)/)?([^/]+)(?:/(.*))?$')
+
+    def __init__(self, bucket):
+        self.bucket = bucket
+        self.buckets = {bucket: {}}
+        self.requests = []
+        self.uploads = {}
+        self.signed = []
+        self._failures = []
+        self._holds = []
+
+    @property
+    def objects(self):
+        """Objects of the default bucket."""
+        return self.buckets[self.bucket]
+
+    def fail(self, method, fragment, status=500, times=1):
+        self._failures.extend([(method, fragment, status)] * times)
+
+    def hold(self, method, fragment):
+        release = threading.Event()
+        self._holds.append((method, fragment, release))
+        return release
+
+    def count(self, method, fragment=''):
+        return sum(1 for m, p in self.requests if m == method and fragment in p)
+
+    def handle(self, request):
+        method = request.method
+        path = unquote(request.url.path)
+        self.requests.append((method, path))
+
+        for held_method, fragment, release in self._holds:
+            if held_method == method and fragment in path:
+                assert release.wait(5), f"{method} {path} was held for too long"
+
+        for failure in self._failures:
+            if failure[0] == method and failure[1] in path:
+                self._failures.remove(failure)
+                if failure[2] is None:
+                    raise httpx.ConnectError('connection reset', request=request)
+                return httpx.Response(failure[2])
+
+        if path.startswith('/storage/v1/upload/resumable'):
+            return self._resumable(method, path, request)
+        if path.startswith('/storage/v1/object/upload/sign/'):
+            self.signed.append(path[len('/storage/v1/object/upload/sign/'):])
+            url = f"{path[len('/storage/v1'):]}?token=token-{len(self.signed)}"
+            return httpx.Response(200, json={'url': url})
+        match = self.OBJECT_PATH.match(path)
+        if match is None:
+            return httpx.Response(404)
+        action, bucket, name = match.groups()
+        if bucket not in self.buckets:
+            return httpx.Response(400, json={'statusCode': '404', 'error': 'Bucket not found'})
+        objects = self.buckets[bucket]
+        if action == 'list':
+            return self._list(objects, json.loads(request.content))
+        if action == 'info':
+            return self._info(objects, name)
+        if name is None and method == 'DELETE':
+            for name in json.loads(request.content)['prefixes']:
+                objects.pop(name, None)
+            return httpx.Response(200, json=[])
+        return self._object(objects, method, name, request)
+
+    def _object(self, objects, method, name, request):
+        if method == 'POST':
+            objects[name] = {
+                'content': request.content,
+                'content_type': request.headers.get('content-type'),
+                'cache_control': request.headers.get('cache-control'),
+            }
+            return httpx.Response(200, json={'Key': name})
+        if name not in objects:
+            return httpx.Response(400, json={'statusCode': '404', 'error': 'not_found'})
+        content = b'' if method == 'HEAD' else objects[name]['content']
+        return httpx.Response(200, content=content)
+
+    def _info(self, objects, name):
+        obj = objects.get(name)
+        if obj is None:
+            return httpx.Response(400, json={'statusCode': '404', 'error': 'not_found'})
+        return httpx.Response(200, json={
+            'id': name,
+            'name': name,
+            'size': len(obj['content']),
+            'created_at': '2024-01-01T10:00:00Z',
+            'last_modified': '2024-01-02T10:00:00Z',
+        })
+
+    def _list(self, objects, body):
+        prefix = f"{body['prefix']}/" if body['prefix'] else ''
+        names = set()
+        dirs = set()
+        for key in objects:
+            if key.startswith(prefix):
+                rest = key[len(prefix):]
+                if '/' in rest:
+                    dirs.add(rest.split('/', 1)[0])
+                else:
+                    names.add(rest)
+        entries = [{'name': d, 'id': None, 'metadata': None} for d in sorted(dirs)]
+        entries += [
+            {
+                'name': n,
+                'id': prefix + n,
+                'created_at': '2024-01-01T10:00:00Z',
+                'updated_at': '2024-01-02T10:00:00Z',
+                'metadata': {'size': len(objects[prefix + n]['content'])},
+            }
+            for n in sorted(names)
+        ]
+        start = body['offset']
+        return httpx.Response(200, json=entries[start:start + body['limit']])
+
+    def _resumable(self, method, path, request):
+        if method == 'POST':
+            upload_id = str(len(self.uploads) + 1)
+            self.uploads[upload_id] = {'length': int(request.headers['Upload-Length']), 'data': b''}
+            location = f"/storage/v1/upload/resumable/{upload_id}"
+            return httpx.Response(201, headers={'Location': location})
+        upload = self.uploads[path.rsplit('/', 1)[1]]
+        if method == 'PATCH':
+            if int(request.headers['Upload-Offset']) != len(upload['data']):
+                return httpx.Response(409)
+            upload['data'] += request.content
+        return httpx.Response(204, headers={'Upload-Offset': str(len(upload['data']))})
+
+
+@pytest.fixture
+def supabase(monkeypatch):
+    """Route every Supabase request of the storage backends to a FakeSupabase."""
+    fake = FakeSupabase('test-bucket')
+    client = httpx.Client(transport=httpx.MockTransport(fake.handle))
+    monkeypatch.setattr(storage_backends, '_HTTP_CLIENT', client)
+    monkeypatch.setattr(storage_backends, '_CLIENT_CACHE', {})
+    # default_storage would keep a client bound to an earlier test's transport
+    monkeypatch.setattr(storages, '_storages', {})
+    monkeypatch.setitem(default_storage.__dict__, '_wrapped', empty)
+    monkeypatch.setattr(storage_backends, '_pending', {})
+    monkeypatch.setattr(storage_backends, '_failed', {})
+    monkeypatch.setattr(storage_backends.time, 'sleep', lambda seconds: None)
+    yield fake
+    client.close()
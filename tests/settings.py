@@ -0,0 +1,20 @@
+"""Django settings for the test suite."""
+
+SECRET_KEY = 'django-supabase-storage-tests'
+
+INSTALLED_APPS = [
+    'django.contrib.staticfiles',
+]
+
+USE_TZ = True
+
+STATIC_URL = '/static/'
+
+SUPABASE_URL = 'https://test.supabase.co'
+SUPABASE_KEY = 'test-key'
+SUPABASE_BUCKET = 'test-bucket'
+
+STORAGES = {
+    'default': {'BACKEND': 'django_supabase_storage.SupabaseMediaStorage'},
+    'staticfiles': {'BACKEND': 'django_supabase_storage.SupabaseStaticStorage'},
+}
@@ -0,0 +1,51 @@
+from django_supabase_storage import SupabaseMediaStorage, storage_backends
+
+
+def _store(supabase, *names):
+    for name in names:
+        supabase.objects[name] = {'content': b'x', 'content_type': None, 'cache_control': None}
+
+
+def test_bulk_delete_sends_batches(supabase, monkeypatch):
+    monkeypatch.setattr(storage_backends, 'DELETE_BATCH_SIZE', 2)
+    _store(supabase, *[f"media/{i}.txt" for i in range(5)], 'media/keep.txt')
+
+    SupabaseMediaStorage().bulk_delete([f"{i}.txt" for i in range(5)] + [''])
+
+    assert list(supabase.objects) == ['media/keep.txt']
+    assert supabase.count('DELETE', '/object/test-bucket') == 3
+
+
+def test_bulk_delete_forgets_cached_entries(supabase):
+    _store(supabase, 'media/a.txt', 'media/b.txt')
+    storage = SupabaseMediaStorage()
+    assert storage.exists('a.txt')
+
+    storage.bulk_delete(['a.txt'])
+
+    assert not storage.exists('a.txt')
+    assert storage.exists('b.txt')
+
+
+def test_batched_deletes_send_one_request(supabase):
+    _store(supabase, 'media/a.txt', 'media/b.txt', 'media/c.txt')
+    storage = SupabaseMediaStorage()
+
+    with storage.batched_deletes():
+        storage.delete('a.txt')
+        with storage.batched_deletes():
+            storage.delete('b.txt')
+        assert supabase.count('DELETE') == 0
+
+    assert list(supabase.objects) == ['media/c.txt']
+    assert supabase.count('DELETE') == 1
+
+
+def test_delete_outside_a_batch_is_sent_at_once(supabase):
+    _store(supabase, 'media/a.txt')
+    storage = SupabaseMediaStorage()
+
+    storage.delete('a.txt')
+
+    assert supabase.objects == {}
+    assert supabase.count('DELETE') == 1
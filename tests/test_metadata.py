@@ -0,0 +1,138 @@
+import datetime
+
+import pytest
+from django.core.files.base import ContentFile
+
+from django_supabase_storage import SupabaseMediaStorage, storage_backends
+
+
+def _store(supabase, *names):
+    for name in names:
+        supabase.objects[name] = {'content': b'12345', 'content_type': None, 'cache_control': None}
+
+
+def test_exists_answers_siblings_from_one_listing(supabase):
+    _store(supabase, 'media/u/a.txt', 'media/u/b.txt', 'media/u/c.txt')
+    storage = SupabaseMediaStorage()
+
+    assert storage.exists('u/a.txt')
+    assert storage.exists('u/b.txt')
+    assert storage.size('u/c.txt') == 5
+
+    assert supabase.count('POST', '/object/list/') == 1
+    assert supabase.count('HEAD') == 0
+    assert supabase.count('GET', '/object/info/') == 0
+
+
+def test_exists_confirms_a_miss_live(supabase):
+    _store(supabase, 'media/u/other.txt')
+    first = SupabaseMediaStorage()
+    second = SupabaseMediaStorage()
+    assert not first.exists('u/report.pdf')
+
+    second.save('u/report.pdf', ContentFile(b'second'))
+
+    assert first.exists('u/report.pdf')
+    assert first.save('u/report.pdf', ContentFile(b'first')) != 'u/report.pdf'
+    assert supabase.objects['media/u/report.pdf']['content'] == b'second'
+
+
+def test_save_forgets_only_its_own_entry(supabase):
+    _store(supabase, *[f"media/u/{i}.txt" for i in range(5)])
+    storage = SupabaseMediaStorage()
+    assert storage.exists('u/0.txt')
+
+    storage.save('u/new.txt', ContentFile(b'new'))
+    storage.delete('u/0.txt')
+
+    assert storage.exists('u/1.txt')
+    assert storage.size('u/new.txt') == 3
+    assert not storage.exists('u/0.txt')
+    assert supabase.count('POST', '/object/list/') == 1
+
+
+def test_delete_drops_the_cached_entry(supabase):
+    _store(supabase, 'media/a.txt')
+    storage = SupabaseMediaStorage()
+    assert storage.exists('a.txt')
+
+    storage.delete('a.txt')
+
+    assert not storage.exists('a.txt')
+
+
+def test_metadata_getters(supabase):
+    _store(supabase, 'media/a.txt')
+    storage = SupabaseMediaStorage()
+
+    assert storage.get_modified_time('a.txt') == datetime.datetime(
+        2024, 1, 2, 10, tzinfo=datetime.timezone.utc
+    )
+    assert storage.size('missing.txt') == 0
+    assert storage.get_modified_time('missing.txt') is None
+
+
+def test_metadata_getters_return_local_time_without_tz(supabase, settings):
+    settings.USE_TZ = False
+    settings.TIME_ZONE = 'America/New_York'
+    _store(supabase, 'media/a.txt')
+
+    assert SupabaseMediaStorage().get_modified_time('a.txt') == datetime.datetime(2024, 1, 2, 5)
+
+
+def test_listdir_reads_every_page(supabase, monkeypatch):
+    monkeypatch.setattr(storage_backends, 'LIST_PAGE_SIZE', 2)
+    _store(supabase, 'media/d/sub/x.txt', *[f"media/d/{i}.txt" for i in range(4)])
+
+    dirs, files = SupabaseMediaStorage().listdir('d')
+
+    assert dirs == ['sub']
+    assert files == ['0.txt', '1.txt', '2.txt', '3.txt']
+    assert supabase.count('POST', '/object/list/') == 3
+
+
+def test_metadata_cache_is_bounded(supabase, monkeypatch):
+    monkeypatch.setattr(storage_backends, 'METADATA_CACHE_SIZE', 3)
+    _store(supabase, *[f"media/{i}.txt" for i in range(10)])
+    storage = SupabaseMediaStorage()
+
+    storage.listdir('')
+
+    assert len(storage._meta_cache) == 3
+
+
+def test_lru_cache_expires_entries(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(storage_backends.time, 'monotonic', lambda: now[0])
+    cache = storage_backends._LRUCache(ttl=5, max_size=10)
+    cache.set('a', 1)
+
+    now[0] += 5
+    cache.set('b', 2)
+
+    assert cache.get('a') is None
+    assert cache.get('b') == 2
+    assert len(cache) == 1
+
+
+def test_time_getters_raise_oserror_when_supabase_fails(supabase):
+    _store(supabase, 'media/a.txt')
+    supabase.fail('POST', '/object/list/', times=2)
+    supabase.fail('GET', '/object/info/', times=2)
+    storage = SupabaseMediaStorage()
+
+    with pytest.raises(OSError, match='a.txt'):
+        storage.get_modified_time('a.txt')
+    with pytest.raises(OSError, match='a.txt'):
+        storage.get_created_time('a.txt')
+
+
+def test_zero_ttl_looks_up_each_file_directly(supabase, settings):
+    settings.SUPABASE_METADATA_TTL = 0
+    _store(supabase, 'media/u/a.txt')
+    storage = SupabaseMediaStorage()
+
+    assert storage.exists('u/a.txt')
+    assert storage.size('u/a.txt') == 5
+
+    assert supabase.count('POST', '/object/list/') == 0
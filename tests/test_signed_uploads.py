@@ -0,0 +1,65 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+from django.test import RequestFactory
+
+from django_supabase_storage import SupabaseMediaStorage
+from django_supabase_storage.views import signed_upload_url
+
+
+def _post(name=None, method='post'):
+    data = {} if name is None else {'name': name}
+    request = getattr(RequestFactory(), method)('/signed-upload/', data)
+    request.user = SimpleNamespace(is_authenticated=True)
+    return signed_upload_url(request)
+
+
+def test_create_signed_upload_url(supabase):
+    signed = SupabaseMediaStorage().create_signed_upload_url('/u/a.txt')
+
+    assert signed == {
+        'signed_url': (
+            'https://test.supabase.co/storage/v1/object/upload/sign/'
+            'test-bucket/media/u/a.txt?token=token-1'
+        ),
+        'token': 'token-1',
+        'name': 'u/a.txt',
+    }
+    assert supabase.signed == ['test-bucket/media/u/a.txt']
+
+
+def test_create_signed_upload_url_failure(supabase):
+    supabase.fail('POST', '/object/upload/sign/')
+
+    with pytest.raises(IOError, match='a.txt'):
+        SupabaseMediaStorage().create_signed_upload_url('a.txt')
+
+
+def test_view_returns_an_unused_name(supabase):
+    supabase.objects['media/a.txt'] = {'content': b'x', 'content_type': None, 'cache_control': None}
+
+    response = _post('a.txt')
+
+    assert response.status_code == 200
+    body = json.loads(response.content)
+    assert body['name'] != 'a.txt'
+    assert body['name'].startswith('a_') and body['name'].endswith('.txt')
+    assert supabase.signed == [f"test-bucket/media/{body['name']}"]
+
+
+def test_view_requires_a_name(supabase):
+    response = _post()
+
+    assert response.status_code == 400
+    assert supabase.signed == []
+
+
+def test_view_reports_supabase_errors(supabase):
+    supabase.fail('POST', '/object/upload/sign/')
+
+    assert _post('a.txt').status_code == 502
+
+
+def test_view_only_accepts_post(supabase):
+    assert _post('a.txt', method='get').status_code == 405
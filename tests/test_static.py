@@ -0,0 +1,71 @@
+import threading
+
+import pytest
+from django.core.files.base import ContentFile
+
+from django_supabase_storage import SupabaseStaticStorage
+
+
+@pytest.fixture
+def async_static(settings):
+    settings.SUPABASE_STATIC_ASYNC_UPLOAD = True
+    return SupabaseStaticStorage()
+
+
+def test_static_uploads_are_synchronous_by_default(supabase):
+    storage = SupabaseStaticStorage()
+
+    storage.save('css/site.css', ContentFile(b'body {}'))
+
+    assert 'static/css/site.css' in supabase.objects
+    assert list(storage.post_process({'css/site.css': None})) == []
+
+
+def _release_soon(release):
+    timer = threading.Timer(0.05, release.set)
+    timer.start()
+    return timer
+
+
+def test_post_process_waits_for_background_uploads(supabase, async_static):
+    release = supabase.hold('POST', '/object/test-bucket/static/')
+    paths = {}
+    for name in ('css/site.css', 'js/app.js'):
+        async_static.save(name, ContentFile(name.encode()))
+        paths[name] = (async_static, name)
+    assert supabase.objects == {}
+    _release_soon(release)
+
+    # Files are uploaded unchanged: nothing is reported unless it failed
+    assert list(async_static.post_process(paths)) == []
+    assert set(supabase.objects) == {'static/css/site.css', 'static/js/app.js'}
+
+
+def test_post_process_yields_failed_uploads(supabase, async_static):
+    supabase.fail('POST', '/object/test-bucket/static/bad.js', 403)
+    async_static.save('bad.js', ContentFile(b'x'))
+
+    [(name, processed, error)] = async_static.post_process({'bad.js': None})
+
+    assert (name, processed) == ('bad.js', None)
+    assert isinstance(error, IOError)
+
+
+def test_lookups_wait_for_pending_uploads(supabase, async_static):
+    release = supabase.hold('POST', '/object/test-bucket/static/css/site.css')
+    async_static.save('css/site.css', ContentFile(b'body {}'))
+    assert supabase.objects == {}
+    _release_soon(release)
+
+    assert async_static.exists('css/site.css')
+    assert async_static.get_modified_time('css/site.css') is not None
+
+
+def test_failed_pending_upload_is_reported_as_missing(supabase, async_static):
+    supabase.fail('POST', '/object/test-bucket/static/bad.js', 403)
+    async_static.save('bad.js', ContentFile(b'x'))
+
+    assert not async_static.exists('bad.js')
+    assert async_static.get_modified_time('bad.js') is None
+    with pytest.raises(IOError):
+        async_static.wait_pending('bad.js')
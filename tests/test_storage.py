@@ -0,0 +1,102 @@
+import pytest
+from django.core.files.base import ContentFile
+
+from django_supabase_storage import SupabaseMediaStorage, SupabaseStorage, storage_backends
+
+
+def test_storages_share_one_client(supabase, monkeypatch):
+    created = []
+    create = storage_backends._create_client
+
+    def counting_create(url, key):
+        created.append((url, key))
+        return create(url, key)
+
+    monkeypatch.setattr(storage_backends, '_create_client', counting_create)
+
+    first = SupabaseStorage()
+    second = SupabaseMediaStorage()
+
+    assert first.client is second.client
+    assert created == [('https://test.supabase.co', 'test-key')]
+
+
+def test_switching_bucket_after_init_moves_every_request(supabase):
+    class OtherBucketStorage(SupabaseMediaStorage):
+        __slots__ = ()
+
+        def __init__(self):
+            super().__init__()
+            self.bucket_name = 'other'
+
+    supabase.buckets['other'] = {}
+    storage = OtherBucketStorage()
+
+    storage.save('a.txt', ContentFile(b'a'))
+
+    assert storage.bucket_name == 'other'
+    assert list(supabase.buckets['other']) == ['media/a.txt']
+    assert supabase.objects == {}
+    assert storage.size('a.txt') == 1
+    assert storage.url('a.txt') == (
+        'https://test.supabase.co/storage/v1/object/public/other/media/a.txt'
+    )
+
+
+def test_switching_to_a_missing_bucket_reports_it(supabase):
+    storage = SupabaseMediaStorage()
+    storage.bucket_name = 'missing'
+
+    with pytest.raises(IOError, match='Bucket: missing'):
+        storage.save('a.txt', ContentFile(b'a'))
+
+    assert supabase.count('POST', '/object/missing/media/a.txt') == 1
+
+
+def test_url_has_no_double_slash(supabase):
+    class TrailingSlashStorage(SupabaseStorage):
+        __slots__ = ()
+        folder_path = 'uploads/'
+
+    base = 'https://test.supabase.co/storage/v1/object/public/test-bucket/'
+
+    assert SupabaseStorage().url('a.txt') == base + 'a.txt'
+    assert TrailingSlashStorage().url('/a.txt') == base + 'uploads/a.txt'
+    assert SupabaseMediaStorage().url('') == ''
+
+
+def test_urls_bulk_keeps_order_and_empty_names(supabase):
+    storage = SupabaseMediaStorage()
+    names = ['b.txt', '', 'a/c.txt', None]
+
+    urls = storage.urls_bulk(names)
+
+    assert urls == [storage.url(name) for name in names]
+    assert urls[0].endswith('/test-bucket/media/b.txt')
+    assert urls[1] == urls[3] == ''
+
+
+def test_settings_are_read_once_per_class(supabase, monkeypatch):
+    loads = []
+    load = SupabaseMediaStorage._load_settings.__func__
+
+    def counting_load(cls):
+        loads.append(cls)
+        load(cls)
+
+    monkeypatch.setattr(SupabaseMediaStorage, '_load_settings', classmethod(counting_load))
+    SupabaseMediaStorage._configured = False
+
+    SupabaseMediaStorage()
+    SupabaseMediaStorage()
+
+    assert loads == [SupabaseMediaStorage]
+
+
+def test_settings_are_reloaded_when_changed(supabase, settings):
+    assert SupabaseMediaStorage().cache_control == '3600'
+
+    settings.SUPABASE_CACHE_CONTROL = 60
+
+    assert SupabaseMediaStorage().cache_control == '60'
+    assert SupabaseStorage().cache_control == '60'
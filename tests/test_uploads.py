@@ -0,0 +1,148 @@
+import io
+import threading
+
+import httpx
+import pytest
+from django.core.files.base import ContentFile
+
+from django_supabase_storage import SupabaseMediaStorage, SupabaseStorage, storage_backends
+
+
+def test_save_uploads_under_folder_path(supabase):
+    storage = SupabaseMediaStorage()
+
+    name = storage.save('docs/report.pdf', ContentFile(b'%PDF-1.4'))
+
+    assert name == 'docs/report.pdf'
+    stored = supabase.objects['media/docs/report.pdf']
+    assert stored['content'] == b'%PDF-1.4'
+    assert stored['content_type'] == 'application/pdf'
+    assert stored['cache_control'] == 'max-age=3600'
+
+
+def test_save_without_folder_has_no_leading_slash(supabase):
+    SupabaseStorage().save('a.txt', ContentFile(b'a'))
+
+    assert list(supabase.objects) == ['a.txt']
+
+
+def test_save_retries_server_errors(supabase):
+    supabase.fail('POST', '/object/test-bucket/media/a.txt', 503)
+    supabase.fail('POST', '/object/test-bucket/media/a.txt', None)
+
+    SupabaseMediaStorage().save('a.txt', ContentFile(b'a'))
+
+    assert supabase.count('POST', '/object/test-bucket/media/a.txt') == 3
+    assert 'media/a.txt' in supabase.objects
+
+
+def test_save_does_not_retry_client_errors(supabase):
+    supabase.fail('POST', '/object/test-bucket/media/a.txt', 403)
+
+    with pytest.raises(IOError):
+        SupabaseMediaStorage().save('a.txt', ContentFile(b'a'))
+
+    assert supabase.count('POST', '/object/test-bucket/media/a.txt') == 1
+
+
+@pytest.fixture
+def small_chunks(monkeypatch, settings):
+    settings.SUPABASE_MULTIPART_THRESHOLD = 8
+    monkeypatch.setattr(storage_backends, 'RESUMABLE_CHUNK_SIZE', 4)
+
+
+def test_large_file_is_uploaded_in_chunks(supabase, small_chunks):
+    data = b'0123456789abcdefXY'
+
+    SupabaseMediaStorage().save('big.bin', ContentFile(data))
+
+    assert supabase.uploads['1']['data'] == data
+    assert supabase.count('PATCH') == 5
+    assert supabase.count('POST', '/object/test-bucket/') == 0
+
+
+def test_resumable_upload_resumes_from_server_offset(supabase, small_chunks):
+    data = b'0123456789abcdefXY'
+    supabase.fail('PATCH', '/upload/resumable/1', 502)
+    supabase.fail('HEAD', '/upload/resumable/1', None)
+
+    SupabaseMediaStorage().save('big.bin', io.BytesIO(data))
+
+    assert supabase.uploads['1']['data'] == data
+    assert supabase.count('HEAD', '/upload/resumable/1') == 2
+
+
+def test_resumable_upload_without_location_raises_ioerror(supabase, small_chunks, monkeypatch):
+    monkeypatch.setattr(supabase, '_resumable', lambda method, path, request: httpx.Response(201))
+
+    with pytest.raises(IOError):
+        SupabaseMediaStorage().save('big.bin', ContentFile(b'0123456789abcdef'))
+
+
+def test_open_streams_the_stored_file(supabase):
+    storage = SupabaseMediaStorage()
+    storage.save('a.txt', ContentFile(b'hello'))
+
+    with storage.open('a.txt') as f:
+        assert f.read() == b'hello'
+
+    with pytest.raises(FileNotFoundError):
+        storage.open('missing.txt')
+
+
+@pytest.fixture
+def async_media(settings):
+    settings.SUPABASE_ASYNC_UPLOAD = True
+    return SupabaseMediaStorage()
+
+
+def _release_soon(release):
+    timer = threading.Timer(0.05, release.set)
+    timer.start()
+    return timer
+
+
+def test_open_waits_for_background_upload(supabase, async_media):
+    release = supabase.hold('POST', '/object/test-bucket/media/a.txt')
+    name = async_media.save('a.txt', ContentFile(b'hello'))
+    assert 'media/a.txt' not in supabase.objects
+
+    _release_soon(release)
+
+    with async_media.open(name) as f:
+        assert f.read() == b'hello'
+
+
+def test_delete_waits_for_background_upload(supabase, async_media):
+    release = supabase.hold('POST', '/object/test-bucket/media/a.txt')
+    name = async_media.save('a.txt', ContentFile(b'hello'))
+
+    _release_soon(release)
+    async_media.delete(name)
+
+    async_media.wait_pending()
+    assert 'media/a.txt' not in supabase.objects
+
+
+def test_bulk_delete_waits_for_background_uploads(supabase, async_media):
+    release = supabase.hold('POST', '/object/test-bucket/media/')
+    names = [async_media.save(f"{i}.txt", ContentFile(b'x')) for i in range(3)]
+
+    _release_soon(release)
+    async_media.bulk_delete(names)
+
+    async_media.wait_pending()
+    assert supabase.objects == {}
+
+
+def test_failed_background_upload_is_logged_and_dropped(supabase, async_media, caplog):
+    supabase.fail('POST', '/object/test-bucket/media/a.txt', 403)
+
+    future = async_media._submit_upload('media/a.txt', b'x' * 1024)
+    future.result()
+
+    assert 'Background upload to test-bucket/media/a.txt failed' in caplog.text
+    assert future.exception() is None
+    assert storage_backends._pending == {}
+    assert storage_backends._failed == {}
+    async_media.wait_pending()